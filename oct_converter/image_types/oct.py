@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import imageio
@@ -71,15 +72,32 @@ class OCTVolumeWithMetaData(object):
             show_contours (bool): If set to ``True``, will plot contours on the OCT volume.
         """
         images = rows * cols
-        x_size = rows * self.volume[0].shape[0]
-        y_size = cols * self.volume[0].shape[1]
-        ratio = y_size / x_size
-        slices_indices = np.linspace(0, self.num_slices - 1, images).astype(np.int)
+        slices_indices = np.linspace(0, self.num_slices - 1, images).astype(int)
+        slices = [self.volume[slice_id] for slice_id in slices_indices]
+        # tile the selected slices into a single rows x cols image, padding each
+        # tile to the largest slice so volumes with mixed slice shapes also work
+        shown = [slice for slice in slices if slice is not None]
+        height = max(slice.shape[0] for slice in shown)
+        width = max(slice.shape[1] for slice in shown)
+        ratio = (cols * width) / (rows * height)
+        montage = np.zeros((rows * height, cols * width), dtype=np.float32)
+        for i, slice in enumerate(slices):
+            if slice is not None:
+                # scale each tile by its own range, as imshow did per subplot
+                low, high = np.nanmin(slice), np.nanmax(slice)
+                tile = np.asarray(slice, dtype=np.float32) - low
+                if high > low:
+                    tile /= high - low
+                row, col = divmod(i, cols)
+                montage[
+                    row * height : row * height + slice.shape[0],
+                    col * width : col * width + slice.shape[1],
+                ] = tile
         plt.figure(figsize=(12 * ratio, 12))
-        for i in range(images):
-            slice_id = slices_indices[i]
-            plt.subplot(rows, cols, i + 1)
-            plt.imshow(self.volume[slice_id], cmap="gray")
+        plt.imshow(montage, cmap="gray", vmin=0, vmax=1)
+        plt.autoscale(False)
+        for i, slice_id in enumerate(slices_indices):
+            row, col = divmod(i, cols)
             if show_contours and self.contours is not None:
                 for v in self.contours.values():
                     if (
@@ -87,9 +105,20 @@ class OCTVolumeWithMetaData(object):
                         and v[slice_id] is not None
                         and not np.isnan(v[slice_id]).all()
                     ):
-                        plt.plot(v[slice_id], color="r")
-            plt.axis("off")
-            plt.title("{}".format(slice_id))
+                        plt.plot(
+                            col * width + np.arange(len(v[slice_id])),
+                            row * height + v[slice_id],
+                            color="r",
+                        )
+            plt.text(
+                col * width,
+                row * height,
+                "{}".format(slice_id),
+                color="w",
+                horizontalalignment="left",
+                verticalalignment="top",
+            )
+        plt.axis("off")
         plt.suptitle("OCT volume with {} slices.".format(self.num_slices))
 
         if filepath is not None:
@@ -97,11 +126,13 @@ class OCTVolumeWithMetaData(object):
         else:
             plt.show()
 
-    def save(self, filepath):
+    def save(self, filepath, rescale=True):
         """Saves OCT volume as a video or stack of slices.
 
         Args:
             filepath (str): Location to save volume to. Extension must be in VIDEO_TYPES or IMAGE_TYPES.
+            rescale (bool): If set to ``False``, slices are saved without rescaling the volume
+                to 0-255. Only applies when saving to IMAGE_TYPES.
         """
         extension = os.path.splitext(filepath)[1]
         if extension.lower() in VIDEO_TYPES:
@@ -117,11 +148,18 @@ class OCTVolumeWithMetaData(object):
                 )
             )
             full_base = os.path.splitext(filepath)[0]
-            self.volume = np.array(self.volume).astype("float64")
-            self.volume *= 255.0 / self.volume.max()
-            for index, slice in enumerate(self.volume):
-                filename = "{}_{}{}".format(full_base, index, extension)
-                cv2.imwrite(filename, slice)
+            volume = self.volume
+            if rescale:
+                # rescale a copy so that self.volume is left unchanged
+                volume = np.array(volume, dtype="float64")
+                volume *= 255.0 / volume.max()
+            filenames = [
+                "{}_{}{}".format(full_base, index, extension)
+                for index in range(len(volume))
+            ]
+            # cv2.imwrite releases the GIL while encoding, so write slices in parallel
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                list(executor.map(cv2.imwrite, filenames, volume))
         elif extension.lower() == ".npy":
             np.save(filepath, self.volume)
         else:
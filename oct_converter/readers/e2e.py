@@ -1,24 +1,200 @@
+import struct
 import warnings
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from datetime import datetime, timedelta
-from itertools import chain
 from pathlib import Path
 
 import numpy as np
-from construct import (
-    Array,
-    Float32l,
-    Int8un,
-    Int16un,
-    Int32sn,
-    Int32un,
-    Int64un,
-    PaddedString,
-    Struct,
-)
+from construct import Array, Int16un, Int32un, PaddedString, Struct
 
 from oct_converter.image_types import FundusImageWithMetaData, OCTVolumeWithMetaData
 
+# Structures holding strings are parsed with construct, compiled once at import.
+_HEADER = Struct(
+    "magic1" / PaddedString(12, "ascii"),
+    "version" / Int32un,
+    "unknown" / Array(10, Int16un),
+).compile()
+_PATIENT_ID = Struct(
+    "first_name" / PaddedString(31, "ascii"),
+    "surname" / PaddedString(66, "ascii"),
+    "birthdate" / Int32un,
+    "sex" / PaddedString(1, "ascii"),
+    "patient_id" / PaddedString(25, "ascii"),
+).compile()
+
+# Fixed layout numeric structures are parsed with the struct module.
+# Magic strings and unknown arrays are left as raw bytes.
+_MAIN_DIRECTORY = struct.Struct("<12sI20sIIII")
+_MainDirectory = namedtuple(
+    "MainDirectory",
+    ["magic2", "version", "unknown", "num_entries", "current", "prev", "unknown3"],
+)
+_SUB_DIRECTORY = struct.Struct("<IIIIIIIiHHII")
+_SubDirectory = namedtuple(
+    "SubDirectory",
+    [
+        "pos",
+        "start",
+        "size",
+        "unknown",
+        "patient_id",
+        "study_id",
+        "series_id",
+        "slice_id",
+        "unknown2",
+        "unknown3",
+        "type",
+        "unknown4",
+    ],
+)
+_CHUNK = struct.Struct("<12sIIIIIIIIiHHII")
+_Chunk = namedtuple(
+    "Chunk",
+    [
+        "magic3",
+        "unknown",
+        "unknown2",
+        "pos",
+        "size",
+        "unknown3",
+        "patient_id",
+        "study_id",
+        "series_id",
+        "slice_id",
+        "ind",
+        "unknown4",
+        "type",
+        "unknown5",
+    ],
+)
+_IMAGE = struct.Struct("<IIIII")
+_Image = namedtuple("Image", ["size", "type", "unknown", "width", "height"])
+_LAT = struct.Struct("<14sBB")
+_Lat = namedtuple("Lat", ["unknown", "laterality", "unknown2"])
+_CONTOUR = struct.Struct("<IIII")
+_Contour = namedtuple("Contour", ["unknown0", "id", "unknown1", "width"])
+# following the spec from
+# https://github.com/neurodial/LibE2E/blob/d26d2d9db64c5f765c0241ecc22177bb0c440c87/E2E/dataelements/bscanmetadataelement.cpp#L75
+_BSCAN_METADATA = struct.Struct("<IIIffffIfffI8sIIIIIffIQIf")
+_BscanMetadata = namedtuple(
+    "BscanMetadata",
+    [
+        "unknown1",
+        "imgSizeX",
+        "imgSizeY",
+        "posX1",
+        "posX2",
+        "posY1",
+        "posY2",
+        "zero1",
+        "unknown2",
+        "scaley",
+        "unknown3",
+        "zero2",
+        "unknown4",
+        "zero3",
+        "imgSizeWidth",
+        "numImages",
+        "aktImage",
+        "scanType",
+        "centrePosX",
+        "centrePosY",
+        "unknown5",
+        "acquisitionTime",
+        "numAve",
+        "imgQuality",
+    ],
+)
+
+_INV_GAMMA = 1.0 / 2.4
+# contour values equal to this are missing
+_MAX_F32 = np.finfo(np.float32).max
+# b-scan acquisition times count 100ns intervals from this date
+_EPOCH_1600 = datetime(year=1600, month=12, day=31, hour=23, minute=59)
+
+
+def _make_mantissa_lut():
+    # mantissa bits are stored least significant bit first, so reverse them
+    bits = np.arange(pow(2, 10), dtype=np.uint16)
+    mantissa = np.zeros_like(bits)
+    for bit in range(10):
+        mantissa |= ((bits >> bit) & 1) << (9 - bit)
+    return 1 + mantissa.astype(np.float32) / pow(2, 10)
+
+
+_MANTISSA_LUT = _make_mantissa_lut()
+
+
+def _ufloat16_to_float32(values):
+    """Vectorised version of E2E.uint16_to_ufloat16 for an array of uint16 values.
+
+    Args:
+        values (np.array): Raw uint16 values.
+
+    Returns:
+        np.array of float32
+    """
+    exponent = (values >> 10) & 0x3F
+    return _MANTISSA_LUT[values & 0x3FF] * np.exp2(exponent.astype(np.float32) - 63)
+
+
+def _make_bscan_lut():
+    # gamma corrected 8-bit intensity for every possible raw b-scan value,
+    # computed in float64 (the decoded values are exact in float32) so that
+    # rounding matches the scalar decoder
+    image = _ufloat16_to_float32(np.arange(pow(2, 16), dtype=np.uint16))
+    image = image.astype(np.float64)
+    np.power(image, _INV_GAMMA, out=image)
+    image *= 256
+    # quantise to 8-bit, the depth the volume is saved at
+    np.clip(image, 0, 255, out=image)
+    return image.astype(np.uint8)
+
+
+_BSCAN_LUT = _make_bscan_lut()
+
+
+def _decode_bscan(raw_image, out=None):
+    """Decodes a raw .e2e b-scan into a gamma corrected 8-bit image.
+
+    Args:
+        raw_image (np.array): Raw uint16 b-scan.
+        out (np.array): Optional uint8 array of the same shape to decode into.
+
+    Returns:
+        np.array of uint8
+    """
+    # every uint16 is a valid index; mode="clip" also stops np.take buffering out
+    return np.take(_BSCAN_LUT, raw_image, out=out, mode="clip")
+
+
+def _assemble_volume(bscans, num_slices):
+    """Decodes raw b-scans into a single volume.
+
+    Args:
+        bscans (list of tuple): (slice index, raw uint16 b-scan) pairs.
+        num_slices (int): Number of slices in the volume.
+
+    Returns:
+        tuple: The volume and a boolean array marking which slices were filled.
+        The volume is a 3D uint8 array, with unfilled slices left as zeros, if all
+        b-scans share a shape, and otherwise a list with unfilled slices left as None.
+    """
+    filled = np.zeros(num_slices, dtype=bool)
+    shapes = {raw_image.shape for _, raw_image in bscans}
+    if len(shapes) == 1:
+        volume = np.zeros((num_slices,) + shapes.pop(), dtype=np.uint8)
+        for slice_index, raw_image in bscans:
+            _decode_bscan(raw_image, out=volume[slice_index])
+            filled[slice_index] = True
+    else:
+        volume = [None] * num_slices
+        for slice_index, raw_image in bscans:
+            volume[slice_index] = _decode_bscan(raw_image)
+            filled[slice_index] = True
+    return volume, filled
+
 
 class E2E(object):
     """Class for extracting data from Heidelberg's .e2e file format.
@@ -29,344 +205,236 @@ class E2E(object):
 
     Attributes:
         filepath (str): Path to .img file for reading.
-        header_structure (obj:Struct): Defines structure of volume's header.
-        main_directory_structure (obj:Struct): Defines structure of volume's main directory.
-        sub_directory_structure (obj:Struct): Defines structure of each sub directory in the volume.
-        chunk_structure (obj:Struct): Defines structure of each data chunk.
-        image_structure (obj:Struct): Defines structure of image header.
     """
 
     def __init__(self, filepath):
         self.filepath = Path(filepath)
         if not self.filepath.exists():
             raise FileNotFoundError(self.filepath)
-        self.header_structure = Struct(
-            "magic1" / PaddedString(12, "ascii"),
-            "version" / Int32un,
-            "unknown" / Array(10, Int16un),
-        )
-        self.main_directory_structure = Struct(
-            "magic2" / PaddedString(12, "ascii"),
-            "version" / Int32un,
-            "unknown" / Array(10, Int16un),
-            "num_entries" / Int32un,
-            "current" / Int32un,
-            "prev" / Int32un,
-            "unknown3" / Int32un,
-        )
-        self.sub_directory_structure = Struct(
-            "pos" / Int32un,
-            "start" / Int32un,
-            "size" / Int32un,
-            "unknown" / Int32un,
-            "patient_id" / Int32un,
-            "study_id" / Int32un,
-            "series_id" / Int32un,
-            "slice_id" / Int32sn,
-            "unknown2" / Int16un,
-            "unknown3" / Int16un,
-            "type" / Int32un,
-            "unknown4" / Int32un,
-        )
-        self.chunk_structure = Struct(
-            "magic3" / PaddedString(12, "ascii"),
-            "unknown" / Int32un,
-            "unknown2" / Int32un,
-            "pos" / Int32un,
-            "size" / Int32un,
-            "unknown3" / Int32un,
-            "patient_id" / Int32un,
-            "study_id" / Int32un,
-            "series_id" / Int32un,
-            "slice_id" / Int32sn,
-            "ind" / Int16un,
-            "unknown4" / Int16un,
-            "type" / Int32un,
-            "unknown5" / Int32un,
-        )
-        self.image_structure = Struct(
-            "size" / Int32un,
-            "type" / Int32un,
-            "unknown" / Int32un,
-            "width" / Int32un,
-            "height" / Int32un,
-        )
-        self.patient_id_structure = Struct(
-            "first_name" / PaddedString(31, "ascii"),
-            "surname" / PaddedString(66, "ascii"),
-            "birthdate" / Int32un,
-            "sex" / PaddedString(1, "ascii"),
-            "patient_id" / PaddedString(25, "ascii"),
-        )
-        self.lat_structure = Struct(
-            "unknown" / Array(14, Int8un), "laterality" / Int8un, "unknown2" / Int8un
-        )
-        self.contour_structure = Struct(
-            "unknown0" / Int32un,
-            "id" / Int32un,
-            "unknown1" / Int32un,
-            "width" / Int32un,
-        )
-
-        # following the spec from
-        # https://github.com/neurodial/LibE2E/blob/d26d2d9db64c5f765c0241ecc22177bb0c440c87/E2E/dataelements/bscanmetadataelement.cpp#L75
-        self.bscan_metadata = Struct(
-            "unknown1" / Int32un,
-            "imgSizeX" / Int32un,
-            "imgSizeY" / Int32un,
-            "posX1" / Float32l,
-            "posX2" / Float32l,
-            "posY1" / Float32l,
-            "posY2" / Float32l,
-            "zero1" / Int32un,
-            "unknown2" / Float32l,
-            "scaley" / Float32l,
-            "unknown3" / Float32l,
-            "zero2" / Int32un,
-            "unknown4" / Array(2, Float32l),
-            "zero3" / Int32un,
-            "imgSizeWidth" / Int32un,
-            "numImages" / Int32un,
-            "aktImage" / Int32un,
-            "scanType" / Int32un,
-            "centrePosX" / Float32l,
-            "centrePosY" / Float32l,
-            "unknown5" / Int32un,
-            "acquisitionTime" / Int64un,
-            "numAve" / Int32un,
-            "imgQuality" / Float32l,
-        )
-
-        self.power = pow(2, 10)
         self.sex = None
         self.first_name = None
         self.surname = None
         self.acquisition_date = None
 
-    def read_oct_volume(self):
+    def read_oct_volume(self, include_contours=True, include_metadata=True):
         """Reads OCT data.
 
+        Args:
+            include_contours (bool): If set to ``False``, contour data is skipped.
+            include_metadata (bool): If set to ``False``, b-scan metadata (and so the
+                acquisition date) is skipped.
+
         Returns:
             obj:OCTVolumeWithMetaData
         """
 
-        def _make_lut():
-            LUT = []
-            for i in range(0, pow(2, 16)):
-                LUT.append(self.uint16_to_ufloat16(i))
-            return np.array(LUT)
-
-        LUT = _make_lut()
-
-        with open(self.filepath, "rb") as f:
-            raw = f.read(36)
-            header = self.header_structure.parse(raw)
-
-            raw = f.read(52)
-            main_directory = self.main_directory_structure.parse(raw)
-
-            # traverse list of main directories in first pass
-            directory_stack = []
-
-            current = main_directory.current
-            while current != 0:
-                directory_stack.append(current)
-                f.seek(current)
-                raw = f.read(52)
-                directory_chunk = self.main_directory_structure.parse(raw)
-                current = directory_chunk.prev
-
-            # traverse in second pass and  get all subdirectories
-            chunk_stack = []
-            volume_dict = {}
-            for position in directory_stack:
-                f.seek(position)
-                raw = f.read(52)
-                directory_chunk = self.main_directory_structure.parse(raw)
-
-                for ii in range(directory_chunk.num_entries):
-                    raw = f.read(44)
-                    chunk = self.sub_directory_structure.parse(raw)
-                    volume_string = "{}_{}_{}".format(
-                        chunk.patient_id, chunk.study_id, chunk.series_id
-                    )
-                    if volume_string not in volume_dict.keys():
-                        volume_dict[volume_string] = chunk.slice_id / 2
-                    elif chunk.slice_id / 2 > volume_dict[volume_string]:
-                        volume_dict[volume_string] = chunk.slice_id / 2
-
-                    if chunk.start > chunk.pos:
-                        chunk_stack.append([chunk.start, chunk.size])
-
-            # initalise dict to hold all the image volumes
-            volume_array_dict = {}
-            volume_array_dict_additional = (
-                {}
-            )  # for storage of slices not caught by extraction
-            laterality_dict = {}
-            laterality = None
-            for volume, num_slices in volume_dict.items():
-                if num_slices > 0:
-                    # num_slices + 1 here due to evidence that a slice was being missed off the end in extraction
-                    volume_array_dict[volume] = [0] * int(num_slices + 1)
-
-            contour_dict = defaultdict(lambda: defaultdict(dict))
-
-            # traverse all chunks and extract slices
-            for start, pos in chunk_stack:
-                f.seek(start)
-                raw = f.read(60)
-                chunk = self.chunk_structure.parse(raw)
+        buf = self.filepath.read_bytes()
+        mv = memoryview(buf)
 
-                if chunk.type == 9:  # patient data
-                    raw = f.read(127)
-                    try:
-                        patient_data = self.patient_id_structure.parse(raw)
-                        self.sex = patient_data.sex
-                        self.first_name = patient_data.first_name
-                        self.surname = patient_data.surname
-                        # this gives the birthdate as a Julian date, needs converting to calendar date
-                        self.birthdate = (patient_data.birthdate / 64) - 14558805
-                        self.patient_id = patient_data.patient_id
-                    except Exception:
-                        pass
+        header = _HEADER.parse(buf)
+        main_directory = _MainDirectory._make(
+            _MAIN_DIRECTORY.unpack_from(mv, _HEADER.sizeof())
+        )
 
-                elif chunk.type == 10004:  # bscan metadata
-                    raw = f.read(104)
-                    bscan_metadata = self.bscan_metadata.parse(raw)
-                    start_epoch = datetime(
-                        year=1600, month=12, day=31, hour=23, minute=59
+        volume_dict = {}
+        # raw b-scans as (volume key, slice index, raw image), decoded into
+        # volumes once the number of slices in every volume is known
+        bscans = []
+        laterality_dict = {}
+        laterality = None
+        contour_dict = defaultdict(lambda: defaultdict(dict))
+
+        # handlers for each chunk type, called with the chunk header and the
+        # offset of the data following it
+        def _patient_data(chunk, off):
+            try:
+                patient_data = _PATIENT_ID.parse(buf[off : off + 127])
+                self.sex = patient_data.sex
+                self.first_name = patient_data.first_name
+                self.surname = patient_data.surname
+                # this gives the birthdate as a Julian date, needs converting to calendar date
+                self.birthdate = (patient_data.birthdate / 64) - 14558805
+                self.patient_id = patient_data.patient_id
+            except Exception:
+                pass
+
+        def _bscan_metadata(chunk, off):
+            bscan_metadata = _BscanMetadata._make(_BSCAN_METADATA.unpack_from(mv, off))
+            acquisition_datetime = _EPOCH_1600 + timedelta(
+                seconds=bscan_metadata.acquisitionTime * 1e-7
+            )
+            if self.acquisition_date is None:
+                self.acquisition_date = acquisition_datetime.date()
+
+        def _laterality_data(chunk, off):
+            nonlocal laterality
+            try:
+                laterality_data = _Lat._make(_LAT.unpack_from(mv, off))
+                if laterality_data.laterality == 82:
+                    laterality = "R"
+                elif laterality_data.laterality == 76:
+                    laterality = "L"
+            except Exception:
+                laterality = None
+
+        def _contour_data(chunk, off):
+            contour_data = _Contour._make(_CONTOUR.unpack_from(mv, off))
+            off += _CONTOUR.size
+
+            if contour_data.width > 0:
+                volume_key = (chunk.patient_id, chunk.study_id, chunk.series_id)
+                slice_id = int(chunk.slice_id / 2) - 1
+                contour_name = f"contour{contour_data.id}"
+                try:
+                    raw_volume = np.frombuffer(
+                        buf, dtype="<f4", count=contour_data.width, offset=off
                     )
-                    acquisition_datetime = start_epoch + timedelta(
-                        seconds=bscan_metadata.acquisitionTime * 1e-7
+                    contour = raw_volume.copy()
+                    mask = contour < 1e-9
+                    np.logical_or(mask, contour == _MAX_F32, out=mask)
+                    np.putmask(contour, mask, np.nan)
+                except Exception as e:
+                    warnings.warn(
+                        (
+                            f"Could not read contour "
+                            f"image id {chunk.patient_id}_{chunk.study_id}_{chunk.series_id} "
+                            f"contour name {contour_name} "
+                            f"slice id {slice_id}."
+                        ),
+                        UserWarning,
                     )
-                    if self.acquisition_date is None:
-                        self.acquisition_date = acquisition_datetime.date()
-
-                elif chunk.type == 11:  # laterality data
-                    raw = f.read(20)
-                    try:
-                        laterality_data = self.lat_structure.parse(raw)
-                        if laterality_data.laterality == 82:
-                            laterality = "R"
-                        elif laterality_data.laterality == 76:
-                            laterality = "L"
-                    except Exception:
-                        laterality = None
-
-                elif chunk.type == 10019:  # contour data
-                    raw = f.read(16)
-                    contour_data = self.contour_structure.parse(raw)
-
-                    if contour_data.width > 0:
-                        volume_string = "{}_{}_{}".format(
-                            chunk.patient_id, chunk.study_id, chunk.series_id
-                        )
-                        slice_id = int(chunk.slice_id / 2) - 1
-                        contour_name = f"contour{contour_data.id}"
-                        try:
-                            raw_volume = np.frombuffer(
-                                f.read(contour_data.width * 4), dtype=np.float32
-                            )
-                            contour = np.array(raw_volume)
-                            max_float = np.finfo(np.float32).max
-                            contour[(contour < 1e-9) | (contour == max_float)] = np.nan
-                        except Exception as e:
-                            warnings.warn(
-                                (
-                                    f"Could not read contour "
-                                    f"image id {volume_string}"
-                                    f"contour name {contour_name} "
-                                    f"slice id {slice_id}."
-                                ),
-                                UserWarning,
-                            )
-                        else:
-                            (
-                                contour_dict[volume_string][contour_name][slice_id]
-                            ) = contour
-
-                elif chunk.type == 1073741824:  # image data
-                    raw = f.read(20)
-                    image_data = self.image_structure.parse(raw)
-
-                    if chunk.ind == 1:  # oct data
-                        count = image_data.height * image_data.width
-                        if count == 0:
-                            break
-                        raw_volume = np.fromfile(f, dtype=np.uint16, count=count)
-                        volume_string = "{}_{}_{}".format(
-                            chunk.patient_id, chunk.study_id, chunk.series_id
-                        )
-                        try:
-                            image = LUT[raw_volume].reshape(
-                                image_data.width, image_data.height
-                            )
-                        except Exception:
-                            warnings.warn(
-                                (
-                                    f"Could not reshape image id {volume_string} with "
-                                    f"{len(LUT[raw_volume])} elements into a "
-                                    f"{image_data.width}x"
-                                    f"{image_data.height} array"
-                                ),
-                                UserWarning,
-                            )
-                        else:
-                            image = 256 * pow(image, 1.0 / 2.4)
-
-                            if volume_string in volume_array_dict.keys():
-                                volume_array_dict[volume_string][
-                                    int(chunk.slice_id / 2) - 1
-                                ] = image
-                            else:
-                                # try to capture these additional images
-                                if volume_string in volume_array_dict_additional.keys():
-                                    volume_array_dict_additional[volume_string].append(
-                                        image
-                                    )
-                                else:
-                                    volume_array_dict_additional[volume_string] = [
-                                        image
-                                    ]
-                            # here assumes laterality stored in chunk before the image itself
-                            if laterality and volume_string not in laterality_dict:
-                                laterality_dict[volume_string] = laterality
-
-            contour_data = {}
-            for volume_id, contours in contour_dict.items():
-                if volume_id in volume_dict:
-                    num_slices = int(volume_dict[volume_id]) + 1
                 else:
-                    num_slices = None
-                contour_data[volume_id] = {
-                    k: [None] * (num_slices or len(v)) for k, v in contours.items()
-                }
-
-                for contour_name, contour_values in contours.items():
-                    for slice_id, contour in contour_values.items():
-                        (contour_data[volume_id][contour_name][slice_id]) = contour
-
-            oct_volumes = []
-            for key, volume in chain(
-                volume_array_dict.items(), volume_array_dict_additional.items()
-            ):
-                # remove any initalised volumes that never had image data attached
-                if isinstance(volume[0], int):
-                    continue
-                oct_volumes.append(
-                    OCTVolumeWithMetaData(
-                        volume=volume,
-                        patient_id=self.patient_id,
-                        first_name=self.first_name,
-                        surname=self.surname,
-                        sex=self.sex,
-                        acquisition_date=self.acquisition_date,
-                        volume_id=key,
-                        laterality=laterality_dict.get(key),
-                        contours=contour_data.get(key),
+                    (contour_dict[volume_key][contour_name][slice_id]) = contour
+
+        def _image_data(chunk, off):
+            # returns True if no further chunks should be read
+            image_data = _Image._make(_IMAGE.unpack_from(mv, off))
+            off += _IMAGE.size
+
+            if chunk.ind == 1:  # oct data
+                count = image_data.height * image_data.width
+                if count == 0:
+                    return True
+                # as with np.fromfile, read no further than the end of the file
+                count = min(count, (len(buf) - off) // 2)
+                raw_volume = np.frombuffer(buf, dtype="<u2", count=count, offset=off)
+                volume_key = (chunk.patient_id, chunk.study_id, chunk.series_id)
+                try:
+                    raw_image = raw_volume.reshape(image_data.width, image_data.height)
+                except Exception:
+                    warnings.warn(
+                        (
+                            f"Could not reshape image id "
+                            f"{chunk.patient_id}_{chunk.study_id}_{chunk.series_id} with "
+                            f"{raw_volume.size} elements into a "
+                            f"{image_data.width}x"
+                            f"{image_data.height} array"
+                        ),
+                        UserWarning,
                     )
+                else:
+                    bscans.append((volume_key, int(chunk.slice_id / 2) - 1, raw_image))
+                    # here assumes laterality stored in chunk before the image itself
+                    if laterality and volume_key not in laterality_dict:
+                        laterality_dict[volume_key] = laterality
+
+        chunk_handlers = {
+            9: _patient_data,
+            11: _laterality_data,
+            1073741824: _image_data,
+        }
+        if include_metadata:
+            chunk_handlers[10004] = _bscan_metadata
+        if include_contours:
+            chunk_handlers[10019] = _contour_data
+
+        # traverse list of main directories, extracting each chunk as we go
+        reading_chunks = True
+        current = main_directory.current
+        while current != 0:
+            directory_chunk = _MainDirectory._make(
+                _MAIN_DIRECTORY.unpack_from(mv, current)
+            )
+            off = current + _MAIN_DIRECTORY.size
+            current = directory_chunk.prev
+
+            entries_end = off + directory_chunk.num_entries * _SUB_DIRECTORY.size
+            for fields in _SUB_DIRECTORY.iter_unpack(mv[off:entries_end]):
+                entry = _SubDirectory._make(fields)
+                volume_key = (entry.patient_id, entry.study_id, entry.series_id)
+                if volume_key not in volume_dict.keys():
+                    volume_dict[volume_key] = entry.slice_id / 2
+                elif entry.slice_id / 2 > volume_dict[volume_key]:
+                    volume_dict[volume_key] = entry.slice_id / 2
+
+                if reading_chunks and entry.start > entry.pos:
+                    chunk = _Chunk._make(_CHUNK.unpack_from(mv, entry.start))
+                    handler = chunk_handlers.get(chunk.type)
+                    if handler is not None and handler(
+                        chunk, entry.start + _CHUNK.size
+                    ):
+                        reading_chunks = False
+
+        # group b-scans by volume
+        volume_array_dict = {}
+        volume_array_dict_additional = (
+            {}
+        )  # for storage of slices not caught by extraction
+        for volume_key, slice_index, raw_image in bscans:
+            if volume_dict.get(volume_key, 0) > 0:
+                volume_array_dict.setdefault(volume_key, []).append(
+                    (slice_index, raw_image)
+                )
+            else:
+                # try to capture these additional images
+                volume_array_dict_additional.setdefault(volume_key, []).append(
+                    raw_image
+                )
+
+        contour_data = {}
+        for volume_id, contours in contour_dict.items():
+            if volume_id in volume_dict:
+                num_slices = int(volume_dict[volume_id]) + 1
+            else:
+                num_slices = None
+            contour_data[volume_id] = {
+                k: [None] * (num_slices or len(v)) for k, v in contours.items()
+            }
+
+            for contour_name, contour_values in contours.items():
+                for slice_id, contour in contour_values.items():
+                    (contour_data[volume_id][contour_name][slice_id]) = contour
+
+        volumes = {}
+        for key, num_slices in volume_dict.items():
+            if key in volume_array_dict:
+                # num_slices + 1 here due to evidence that a slice was being missed off the end in extraction
+                volume, filled = _assemble_volume(
+                    volume_array_dict[key], int(num_slices + 1)
                 )
+                # remove any volumes whose first slice never had image data attached
+                if filled[0]:
+                    volumes[key] = volume
+        for key, raw_images in volume_array_dict_additional.items():
+            volumes[key], _ = _assemble_volume(
+                list(enumerate(raw_images)), len(raw_images)
+            )
+
+        oct_volumes = []
+        for key, volume in volumes.items():
+            oct_volumes.append(
+                OCTVolumeWithMetaData(
+                    volume=volume,
+                    patient_id=self.patient_id,
+                    first_name=self.first_name,
+                    surname=self.surname,
+                    sex=self.sex,
+                    acquisition_date=self.acquisition_date,
+                    volume_id="{}_{}_{}".format(*key),
+                    laterality=laterality_dict.get(key),
+                    contours=contour_data.get(key),
+                )
+            )
 
         return oct_volumes
 
@@ -376,53 +444,40 @@ class E2E(object):
         Returns:
             obj:FundusImageWithMetaData
         """
-        with open(self.filepath, "rb") as f:
-            raw = f.read(36)
-            header = self.header_structure.parse(raw)
-
-            raw = f.read(52)
-            main_directory = self.main_directory_structure.parse(raw)
-
-            # traverse list of main directories in first pass
-            directory_stack = []
-
-            laterality = None
-
-            current = main_directory.current
-            while current != 0:
-                directory_stack.append(current)
-                f.seek(current)
-                raw = f.read(52)
-                directory_chunk = self.main_directory_structure.parse(raw)
-                current = directory_chunk.prev
-
-            # traverse in second pass and  get all subdirectories
-            chunk_stack = []
-            for position in directory_stack:
-                f.seek(position)
-                raw = f.read(52)
-                directory_chunk = self.main_directory_structure.parse(raw)
-
-                for ii in range(directory_chunk.num_entries):
-                    raw = f.read(44)
-                    chunk = self.sub_directory_structure.parse(raw)
-                    if chunk.start > chunk.pos:
-                        chunk_stack.append([chunk.start, chunk.size])
-
-            # initalise dict to hold all the image volumes
-            image_array_dict = {}
-            laterality_dict = {}
-
-            # traverse all chunks and extract slices
-            for start, pos in chunk_stack:
-                f.seek(start)
-                raw = f.read(60)
-                chunk = self.chunk_structure.parse(raw)
+        buf = self.filepath.read_bytes()
+        mv = memoryview(buf)
+
+        header = _HEADER.parse(buf)
+        main_directory = _MainDirectory._make(
+            _MAIN_DIRECTORY.unpack_from(mv, _HEADER.sizeof())
+        )
+
+        laterality = None
+
+        # initalise dict to hold all the image volumes
+        image_array_dict = {}
+        laterality_dict = {}
+
+        # traverse list of main directories, extracting each chunk as we go
+        current = main_directory.current
+        while current != 0:
+            directory_chunk = _MainDirectory._make(
+                _MAIN_DIRECTORY.unpack_from(mv, current)
+            )
+            off = current + _MAIN_DIRECTORY.size
+            current = directory_chunk.prev
+
+            entries_end = off + directory_chunk.num_entries * _SUB_DIRECTORY.size
+            for fields in _SUB_DIRECTORY.iter_unpack(mv[off:entries_end]):
+                entry = _SubDirectory._make(fields)
+                if entry.start <= entry.pos:
+                    continue
+                chunk = _Chunk._make(_CHUNK.unpack_from(mv, entry.start))
+                off = entry.start + _CHUNK.size
 
                 if chunk.type == 9:  # patient data
-                    raw = f.read(127)
                     try:
-                        patient_data = self.patient_id_structure.parse(raw)
+                        patient_data = _PATIENT_ID.parse(buf[off : off + 127])
                         self.sex = patient_data.sex
                         self.first_name = patient_data.first_name
                         self.surname = patient_data.surname
@@ -433,9 +488,8 @@ class E2E(object):
                         pass
 
                 if chunk.type == 11:  # laterality data
-                    raw = f.read(20)
                     try:
-                        laterality_data = self.lat_structure.parse(raw)
+                        laterality_data = _Lat._make(_LAT.unpack_from(mv, off))
                         if laterality_data.laterality == 82:
                             laterality = "R"
                         elif laterality_data.laterality == 76:
@@ -444,34 +498,36 @@ class E2E(object):
                         laterality = None
 
                 if chunk.type == 1073741824:  # image data
-                    raw = f.read(20)
-                    image_data = self.image_structure.parse(raw)
+                    image_data = _Image._make(_IMAGE.unpack_from(mv, off))
+                    off += _IMAGE.size
                     count = image_data.height * image_data.width
                     if count == 0:
+                        # stop reading any further chunks
+                        current = 0
                         break
                     if chunk.ind == 0:  # fundus data
-                        raw_volume = np.frombuffer(f.read(count), dtype=np.uint8)
+                        raw_volume = np.frombuffer(
+                            buf, dtype=np.uint8, count=count, offset=off
+                        )
                         image = np.array(raw_volume).reshape(
                             image_data.height, image_data.width
                         )
-                        image_string = "{}_{}_{}".format(
-                            chunk.patient_id, chunk.study_id, chunk.series_id
-                        )
-                        image_array_dict[image_string] = image
+                        image_key = (chunk.patient_id, chunk.study_id, chunk.series_id)
+                        image_array_dict[image_key] = image
                         # here assumes laterality stored in chunk before the image itself
-                        laterality_dict[image_string] = laterality
-            fundus_images = []
-            for key, image in image_array_dict.items():
-                fundus_images.append(
-                    FundusImageWithMetaData(
-                        image=image,
-                        patient_id=self.patient_id,
-                        image_id=key,
-                        laterality=laterality_dict[key]
-                        if key in laterality_dict.keys()
-                        else None,
-                    )
+                        laterality_dict[image_key] = laterality
+        fundus_images = []
+        for key, image in image_array_dict.items():
+            fundus_images.append(
+                FundusImageWithMetaData(
+                    image=image,
+                    patient_id=self.patient_id,
+                    image_id="{}_{}_{}".format(*key),
+                    laterality=laterality_dict[key]
+                    if key in laterality_dict.keys()
+                    else None,
                 )
+            )
 
         return fundus_images
 
@@ -487,18 +543,8 @@ class E2E(object):
         Returns:
             float
         """
-        # convert two bytes to 16-bit binary representation
-        bits = bin(bytes[0])[2:].zfill(8)[::-1] + bin(bytes[1])[2:].zfill(8)[::-1]
-
-        # get mantissa and exponent
-        mantissa = bits[:10]
-        exponent = bits[10:]
-
-        # convert to decimal representations
-        mantissa_sum = 1 + int(mantissa, 2) / self.power
-        exponent_sum = int(exponent[::-1], 2) - 63
-        decimal_value = mantissa_sum * pow(2, exponent_sum)
-        return decimal_value
+        # the two bytes are a little-endian uint16
+        return self.uint16_to_ufloat16(int(bytes[0]) | (int(bytes[1]) << 8))
 
     def uint16_to_ufloat16(self, uint16):
         """Implementation of bespoke float type used in .e2e files.
@@ -512,14 +558,10 @@ class E2E(object):
         Returns:
             float
         """
-        bits = "{0:016b}".format(uint16)[::-1]
-        # get mantissa and exponent
-        mantissa = bits[:10]
-        exponent = bits[10:]
-        exponent = exponent[::-1]
-
-        # convert to decimal representations
-        mantissa_sum = 1 + int(mantissa, 2) / self.power
-        exponent_sum = int(exponent, 2) - 63
-        decimal_value = mantissa_sum * np.float_power(2, exponent_sum)
-        return decimal_value
+        # use a Python int so NumPy integer inputs cannot wrap around
+        uint16 = int(uint16)
+        # the mantissa is the low 10 bits, stored least significant bit first,
+        # and the exponent the high 6 bits
+        mantissa_sum = float(_MANTISSA_LUT[uint16 & 0x3FF])
+        exponent_sum = ((uint16 >> 10) & 0x3F) - 63
+        return mantissa_sum * 2.0**exponent_sum